@@ -23,8 +23,8 @@
 # +
 import os
 import tempfile
-import time
 
+import psutil
 from ansys.aedt.core import Desktop, Hfss, settings
 from ansys.aedt.core.examples.downloads import download_file
 
@@ -55,12 +55,13 @@ temp_folder = tempfile.TemporaryDirectory(suffix=".ansys")
 # of examples and models from the Ansys GitHub organization:
 # [example-data repository](https://github.com/ansys/example-data/tree/master/pyaedt). Download the "old"
 # encrypted 3D component and define a name to use for the new, converted component.
+# The component is only read, so it is used from the PyAEDT examples folder, where
+# ``download_file()`` keeps it for later runs.
 
 # +
 a3dcomp = download_file(
     source="component_3d",
     name="SMA_Edge_Connector_23r2_encrypted_password_ansys.a3dcomp",
-    local_path=temp_folder.name,
 )
 
 # Name of the converted 3D component:
@@ -82,9 +83,12 @@ settings.use_multi_desktop = True
 # Pass the keyword argument ``aedt_process_id`` to ensure that the ``Hfss``
 # instance connects to the correct running version of HFSS. The encryption
 # password must be provided to enable conversion.
+#
+# The old version is only used as the source of the geometry, so it is
+# always launched in non-graphical mode to reduce its startup time and memory use.
 
 # +
-aedt_old = Desktop(new_desktop=True, version=OLD_AEDT_VERSION)
+aedt_old = Desktop(new_desktop=True, version=OLD_AEDT_VERSION, non_graphical=True)
 
 # Insert an empty HFSS design.
 hfss1 = Hfss(aedt_process_id=aedt_old.aedt_process_id, solution_type="Terminal")
@@ -109,7 +113,7 @@ app_comp = cmp.edit_definition(password="ansys")
 # correct version and instance of AEDT.
 
 # +
-aedt = Desktop(new_desktop=True, version=AEDT_VERSION)
+aedt = Desktop(new_desktop=True, version=AEDT_VERSION, non_graphical=NG_MODE)
 
 # Insert an empty HFSS design.
 hfss2 = Hfss(aedt_process_id=aedt.aedt_process_id, solution_type="Terminal")
@@ -134,11 +138,12 @@ hfss2.modeler.create_3dcomponent(
 
 aedt.save_project()
 aedt_old.save_project()
+aedt_processes = [psutil.Process(aedt.aedt_process_id), psutil.Process(aedt_old.aedt_process_id)]
 aedt.release_desktop()
 aedt_old.release_desktop()
 print(f"The new encrypted 3D component can be retrieved from: {new_component_filename}")
-# Wait 3 seconds to allow AEDT to shut down before cleaning the temporary directory.
-time.sleep(3)
+# Wait for both AEDT sessions to shut down before cleaning the temporary directory.
+psutil.wait_procs(aedt_processes, timeout=30)
 
 # ### Clean up
 #
@@ -17,8 +17,8 @@
 # +
 import os
 import tempfile
-import time
 
+import psutil
 from ansys.aedt.core import Hfss
 
 # -
@@ -122,30 +122,29 @@ via_outer = hfss.modeler.create_cylinder(
 #
 # Boundary conditions can be assigned to faces or bodies in the model
 # using methods of the ``Hfss`` class.
-
-hfss.assign_perfecte_to_sheets(patch, name="patch_bc")
-
-# ### Assign boundaries to the via
 #
 # The following statement selects the outer surface of the cylinder
-# ``via_outer``, excluding the upper and lower faces, and assigns
-# the "perfect conductor" boundary condition.
+# ``via_outer``, excluding the upper and lower faces. The "perfect conductor"
+# boundary condition is then assigned to the patch, to the outer surface of the via,
+# and to the bottom face of the substrate in a single call.
 
 # +
-side_face = [i for i in via_outer.faces if i.id not in [via_outer.top_face_z.id, via_outer.bottom_face_z.id]]
+via_top_face = via_outer.top_face_z
+via_bottom_face = via_outer.bottom_face_z
+via_top_bottom_ids = frozenset({via_top_face.id, via_bottom_face.id})
+side_face = [i for i in via_outer.faces if i.id not in via_top_bottom_ids]
 
-hfss.assign_perfecte_to_sheets(side_face, name="feed_gnd")
-hfss.assign_perfecte_to_sheets(substrate.bottom_face_z, name="ground_plane")
-hfss.assign_perfecth_to_sheets(via_outer.top_face_z, name="feed_thru")  # Ensure power flows through the ground plane.
+hfss.assign_perfecte_to_sheets([patch] + side_face + [substrate.bottom_face_z], name="pec")
+hfss.assign_perfecth_to_sheets(via_top_face, name="feed_thru")  # Ensure power flows through the ground plane.
 hfss.change_material_override(material_override=True)  # Allow the probe feed to extend outside the substrate.
 # -
 
 # ### Create wave port
 #
-# A wave port is assigned to the bottom face of the via. Note that the property `via_outer.bottom_face_z`
-# is a ``FacePrimitive`` object.
+# A wave port is assigned to the bottom face of the via. Note that the property `via_outer.bottom_face_z`,
+# stored in ``via_bottom_face``, is a ``FacePrimitive`` object.
 
-p1 = hfss.wave_port(via_outer.bottom_face_z, name="P1", create_pec_cap=True)
+p1 = hfss.wave_port(via_bottom_face, name="P1", create_pec_cap=True)
 
 # ### Query the object properties
 #
@@ -153,11 +152,11 @@ p1 = hfss.wave_port(via_outer.bottom_face_z, name="P1", create_pec_cap=True)
 # properties to obtain detailed information as shown below:
 
 out_str = f"A port named '{p1.name}' was assigned to a surface object"
-out_str += f" of type \n   {type(via_outer.bottom_face_z)}\n"
+out_str += f" of type \n   {type(via_bottom_face)}\n"
 out_str += f"which is located at the bottom surface of the object '{via_outer.name}'\n"
-out_str += f"at the z-elevation: {via_outer.bottom_face_z.bottom_edge_z} "
+out_str += f"at the z-elevation: {via_bottom_face.bottom_edge_z} "
 out_str += f"{hfss.modeler.model_units}\n"
-out_str += f"and has the face ID: {via_outer.bottom_face_z.id}."
+out_str += f"and has the face ID: {via_bottom_face.id}."
 print(out_str)
 
 # ## Create 3D component
@@ -255,8 +254,12 @@ else:
 # -
 
 # ### Visualize the model
+#
+# The model image is rendered by PyVista and does not depend on the AEDT view.
+# The AEDT view is only zoomed to fit when the UI is open.
 
-hfss2.modeler.fit_all()
+if not NG_MODE:
+    hfss2.modeler.fit_all()
 hfss2.plot(
     show=False,
     output_file=os.path.join(hfss.working_directory, "Image.jpg"),
@@ -268,9 +271,10 @@ hfss2.plot(
 # ### Save the project
 
 hfss2.save_project()
+aedt_process = psutil.Process(hfss2.desktop_class.aedt_process_id)
 hfss2.release_desktop()
-# Wait 3 seconds to allow AEDT to shut down before cleaning the temporary directory.
-time.sleep(3)
+# Wait for AEDT to shut down before cleaning the temporary directory.
+psutil.wait_procs([aedt_process], timeout=30)
 
 # ### Clean up
 #
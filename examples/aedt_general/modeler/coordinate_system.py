@@ -13,6 +13,7 @@ import tempfile
 import time
 
 import ansys.aedt.core
+import numpy as np
 
 # -
 
@@ -267,6 +268,30 @@ print("Global: ", p)
 p2 = hfss.modeler.global_to_cs(p, "CS5")
 print("CS5 :", p2)
 
+# ### Transform many points at once
+#
+# Each call to ``global_to_cs`` evaluates the coordinate system transformation
+# for a single point. Because the transformation is affine, it can be evaluated
+# once from the images of the origin and the three unit vectors. The resulting
+# matrix is then applied to any number of points with a single NumPy operation.
+# Here all vertices of ``Box1`` are converted to ``CS5``.
+
+
+def global_to_cs_many(modeler, points, cs_name):
+    offset = np.asarray(modeler.global_to_cs([0, 0, 0], cs_name), dtype=np.float64)
+    axes = np.asarray([modeler.global_to_cs(unit, cs_name) for unit in np.eye(3).tolist()], dtype=np.float64)
+    transform = np.eye(4)
+    transform[:3, :3] = (axes - offset).T
+    transform[:3, 3] = offset
+    points = np.asarray(points, dtype=np.float64)
+    homogeneous = np.hstack([points, np.ones((len(points), 1))])
+    return (homogeneous @ transform.T)[:, :3]
+
+
+vertices = [v.position for v in hfss.modeler["Box1"].vertices]
+vertices_cs5 = global_to_cs_many(hfss.modeler, vertices, "CS5")
+print("CS5 vertices:", vertices_cs5)
+
 # ## Release AEDT
 # Close the project and release AEDT.
 
@@ -10,9 +10,9 @@
 # +
 import os
 import tempfile
-import time
 
 import ansys.aedt.core
+import psutil
 
 # -
 
@@ -218,12 +218,9 @@ line8_segment_arc.insert_segment(points=[start_point, insert_point1, insert_poin
 start_point = [2200.0, 0.0, 1200.0]
 arc_center_1 = [1400, 0, 800]
 arc_angle_1 = "43.47deg"
+arc_segment_1 = modeler.polyline_segment(type="AngularArc", arc_angle=arc_angle_1, arc_center=arc_center_1)
 
-line_arc = modeler.create_polyline(
-    name="First_Arc",
-    points=[start_point],
-    segment_type=modeler.polyline_segment(type="AngularArc", arc_angle=arc_angle_1, arc_center=arc_center_1),
-)
+line_arc = modeler.create_polyline(name="First_Arc", points=[start_point], segment_type=arc_segment_1)
 # -
 
 # Step 2: Insert a line segment at the end of the arc with a specified end point.
@@ -236,21 +233,16 @@ line_arc.insert_segment(points=[start_of_line_segment, end_of_line_segment])
 
 arc_angle_2 = "39.716deg"
 arc_center_2 = [3400, 200, 3800]
-line_arc.insert_segment(
-    points=[end_of_line_segment],
-    segment=modeler.polyline_segment(type="AngularArc", arc_center=arc_center_2, arc_angle=arc_angle_2),
-)
+arc_segment_2 = modeler.polyline_segment(type="AngularArc", arc_center=arc_center_2, arc_angle=arc_angle_2)
+line_arc.insert_segment(points=[end_of_line_segment], segment=arc_segment_2)
 
 # You can use the compound polyline definition to complete all three steps in
-# a single step.
+# a single step. The segment definitions created above are reused, so they
+# are not built again.
 
 modeler.create_polyline(
     points=[start_point, end_of_line_segment],
-    segment_type=[
-        modeler.polyline_segment(type="AngularArc", arc_angle="43.47deg", arc_center=arc_center_1),
-        modeler.polyline_segment(type="Line"),
-        modeler.polyline_segment(type="AngularArc", arc_angle=arc_angle_2, arc_center=arc_center_2),
-    ],
+    segment_type=[arc_segment_1, modeler.polyline_segment(type="Line"), arc_segment_2],
     name="Compound_Polyline_One_Command",
 )
 
@@ -306,8 +298,9 @@ line_complex2 = modeler.create_polyline(line_points, segment_type=line_segments,
 # Save the project.
 
 maxwell.save_project()
+aedt_process = psutil.Process(maxwell.desktop_class.aedt_process_id)
 maxwell.release_desktop()
-time.sleep(3)  # Allow AEDT to shut down before cleaning the temporary project folder.
+psutil.wait_procs([aedt_process], timeout=30)  # Wait for AEDT to shut down before cleaning the temporary project folder.
 
 # ## Clean up
 #
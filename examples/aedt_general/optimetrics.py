@@ -11,9 +11,9 @@
 # +
 import os
 import tempfile
-import time
 
 import ansys.aedt.core
+import psutil
 from ansys.aedt.core.generic.constants import Axis
 
 # -
@@ -21,7 +21,10 @@ from ansys.aedt.core.generic.constants import Axis
 # Define constants.
 
 AEDT_VERSION = "2026.1"
+NUM_CORES = 4
+NUM_TASKS = 4  # Number of parametric variations solved in parallel.
 NG_MODE = False  # Open AEDT UI when it is launched.
+SOLVE_PARAMETRICS = False  # Set to ``True`` to solve the parametric analysis in batch.
 
 # ## Create temporary directory
 #
@@ -84,6 +87,11 @@ hfss.wave_port(p2, integration_line=hfss.axis_directions.ZPos, name="2")
 #
 # Create a setup and a frequency sweep to use as the base for optimetrics
 # setups.
+#
+# An interpolating sweep reuses the solutions at a few frequencies to fit the
+# whole band, rather than solving every frequency point. The optimetrics
+# calculations only use S-parameters, and the far-field calculation uses the
+# adaptive solution, so fields are not saved for the sweep.
 
 setup = hfss.create_setup()
 hfss.create_linear_step_sweep(
@@ -93,9 +101,19 @@ hfss.create_linear_step_sweep(
     stop_frequency=5,
     step_size=0.1,
     name="Sweep1",
-    save_fields=True,
+    save_fields=False,
+    sweep_type="Interpolating",
 )
 
+# ## Create output variable
+#
+# All optimetrics analyses below evaluate the return loss. Define it once as
+# an output variable and reference it by name in each analysis, rather than
+# declaring the same ``dB(S(1,1))`` expression in every calculation and goal.
+
+s11_db = "S11_dB"
+hfss.create_output_variable(variable=s11_db, expression="dB(S(1,1))")
+
 # ## Create optimetrics analyses
 #
 # ### Create parametric analysis
@@ -104,27 +122,27 @@ hfss.create_linear_step_sweep(
 
 sweep = hfss.parametrics.add("w2", 90, 200, 5)
 sweep.add_variation("w1", 0.1, 2, 10)
-sweep.add_calculation(calculation="dB(S(1,1))", ranges={"Freq": "2.5GHz"})
-sweep.add_calculation(calculation="dB(S(1,1))", ranges={"Freq": "2.6GHz"})
+sweep.add_calculation(calculation=s11_db, ranges={"Freq": "2.5GHz"})
+sweep.add_calculation(calculation=s11_db, ranges={"Freq": "2.6GHz"})
 
 # ### Create sensitivity analysis
 #
 # Create an optimetrics sensitivity analysis with output calculations.
 
-sweep2 = hfss.optimizations.add(calculation="dB(S(1,1))", ranges={"Freq": "2.5GHz"}, optimization_type="Sensitivity")
+sweep2 = hfss.optimizations.add(calculation=s11_db, ranges={"Freq": "2.5GHz"}, optimization_type="Sensitivity")
 sweep2.add_variation("w1", 0.1, 3, 0.5)
-sweep2.add_calculation(calculation="dB(S(1,1))", ranges={"Freq": "2.6GHz"})
+sweep2.add_calculation(calculation=s11_db, ranges={"Freq": "2.6GHz"})
 
 # ### Create an optimization analysis
 #
 # Create an optimization analysis based on goals and calculations.
 
-sweep3 = hfss.optimizations.add(calculation="dB(S(1,1))", ranges={"Freq": "2.5GHz"})
+sweep3 = hfss.optimizations.add(calculation=s11_db, ranges={"Freq": "2.5GHz"})
 sweep3.add_variation("w1", 0.1, 3, 0.5)
-sweep3.add_goal(calculation="dB(S(1,1))", ranges={"Freq": "2.6GHz"})
-sweep3.add_goal(calculation="dB(S(1,1))", ranges={"Freq": ("2.6GHz", "5GHz")})
+sweep3.add_goal(calculation=s11_db, ranges={"Freq": "2.6GHz"})
+sweep3.add_goal(calculation=s11_db, ranges={"Freq": ("2.6GHz", "5GHz")})
 sweep3.add_goal(
-    calculation="dB(S(1,1))",
+    calculation=s11_db,
     ranges={"Freq": ("2.6GHz", "5GHz")},
     condition="Maximize",
 )
@@ -134,17 +152,17 @@ sweep3.add_goal(
 # Create a DesignXplorer optimization based on a goal and a calculation.
 
 sweep4 = hfss.optimizations.add(
-    calculation="dB(S(1,1))",
+    calculation=s11_db,
     ranges={"Freq": "2.5GHz"},
     optimization_type="DesignExplorer",
 )
-sweep4.add_goal(calculation="dB(S(1,1))", ranges={"Freq": "2.6GHz"})
+sweep4.add_goal(calculation=s11_db, ranges={"Freq": "2.6GHz"})
 
 # ### Create a Design of Experiments (DOE)
 #
 # Create a DOE based on a goal and a calculation.
 
-sweep5 = hfss.optimizations.add(calculation="dB(S(1,1))", ranges={"Freq": "2.5GHz"}, optimization_type="DXDOE")
+sweep5 = hfss.optimizations.add(calculation=s11_db, ranges={"Freq": "2.5GHz"}, optimization_type="DXDOE")
 
 # ### Create another DOE
 #
@@ -160,11 +178,25 @@ sweep6 = hfss.optimizations.add(
     context="Infinite_1",
 )
 
-# ## Release AEDT
+# ## Solve parametric analysis in batch
+#
+# The parametric analysis contains many independent variations. Solving it in batch
+# with several tasks distributes the variations across the available cores instead
+# of solving them one at a time. PyAEDT saves and closes the project before it is
+# submitted, so only the parametric sweep is solved.
+#
+# > **Note:** The parametric analysis is not solved by default because it takes
+# > a long time. Set ``SOLVE_PARAMETRICS`` to ``True`` to run it.
 
 hfss.save_project()
+if SOLVE_PARAMETRICS:
+    hfss.solve_in_batch(cores=NUM_CORES, tasks=NUM_TASKS, setup=sweep.name)
+
+# ## Release AEDT
+
+aedt_process = psutil.Process(hfss.desktop_class.aedt_process_id)
 hfss.release_desktop()
-time.sleep(3)  # Allow AEDT to shut down before cleaning the temporary project folder.
+psutil.wait_procs([aedt_process], timeout=30)  # Wait for AEDT to shut down before cleaning the temporary project folder.
 
 # ## Clean up
 #
@@ -60,7 +60,6 @@ h3d.setups[0].sweeps[0].props["Sweeps"]["Data"] = "LIN 0MHz 70GHz 0.1GHz"
 h3d.setups[0].sweeps[0].props["EnforceCausality"] = True
 h3d.setups[0].sweeps[0].update()
 h3d.analyze(cores=NUM_CORES)
-h3d = ansys.aedt.core.Hfss3dLayout()
 touchstone_path = h3d.export_touchstone()
 
 # ## Create LNA project
@@ -80,25 +79,28 @@ status, diff_pairs, comm_pairs = circuit.create_lna_schematic_from_snp(
 circuit.design_name = "LNA"
 circuit.analyze(cores=NUM_CORES)
 
+# Build the insertion and return loss trace names for the receiver nets.
+
+rx_nets = ["RX0", "RX1", "RX2", "RX3"]
 insertion = circuit.get_all_insertion_loss_list(
     drivers=diff_pairs,
     receivers=diff_pairs,
     drivers_prefix_name="X1",
     receivers_prefix_name="U1",
     math_formula="dB",
-    nets=["RX0", "RX1", "RX2", "RX3"],
+    nets=rx_nets,
 )
 return_diff = circuit.get_all_return_loss_list(
     excitations=diff_pairs,
     excitation_name_prefix="X1",
     math_formula="dB",
-    nets=["RX0", "RX1", "RX2", "RX3"],
+    nets=rx_nets,
 )
 return_comm = circuit.get_all_return_loss_list(
     excitations=comm_pairs,
     excitation_name_prefix="COMMON_X1",
     math_formula="dB",
-    nets=["RX0", "RX1", "RX2", "RX3"],
+    nets=rx_nets,
 )
 
 # ## Create TDR project
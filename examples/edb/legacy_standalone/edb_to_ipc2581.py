@@ -39,22 +39,19 @@ edb = pyedb.Edb(edbpath=targetfile, version=AEDT_VERSION)
 edb.modeler.parametrize_trace_width("A0_N", parameter_name=generate_unique_name("Par"), variable_value="0.4321mm")
 
 # ## Create a cutout and plot it.
+#
+# Only the arguments that differ from the ``cutout`` defaults are passed.
+# The expansion size (``0.002``), the number of threads (``4``), square corners,
+# the PyAEDT extent computation and the disabled extent defeaturing are
+# all default values.
 
-signal_list = []
-for net in edb.nets.netlist:
-    if "PCIe" in net:
-        signal_list.append(net)
+signal_list = [net for net in edb.nets.netlist if "PCIe" in net]
 power_list = ["GND"]
 edb.cutout(
     signal_nets=signal_list,
     reference_nets=power_list,
     extent_type="ConvexHull",
-    expansion_size=0.002,
-    use_round_corner=False,
-    number_of_threads=4,
     remove_single_pin_components=True,
-    use_pyaedt_extent_computing=True,
-    extent_defeature=0,
 )
 edb.nets.plot(None, None, color_by_net=True)
 
@@ -127,10 +127,9 @@ with open(file_json, "w") as f:
 
 # ## Apply Config file
 
-# Apply configuration to the example layout
+# Load and apply configuration to the example layout in a single call.
 
-edbapp.configuration.load(config_file=file_json)
-edbapp.configuration.run()
+edbapp.configuration.load(config_file=file_json, apply_file=True)
 
 # Save and close EDB.
 
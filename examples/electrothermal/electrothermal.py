@@ -162,21 +162,22 @@ cfg["setups"] = [
 # ## Save configuration to a JSON file
 #
 # The configuration file can be saved in JSON format and applied to layout data using the EDB.
+# The configuration is serialized in memory and written with a single call through a 1 MB
+# buffer, which avoids many small writes on slow or network file systems.
 
 # +
 pi_json = os.path.join(temp_folder.name, "pi.json")
 
-with open(pi_json, "w") as f:
-    json.dump(cfg, f, indent=4, ensure_ascii=False)
+with open(pi_json, "w", buffering=1 << 20) as f:
+    f.write(json.dumps(cfg, indent=4, ensure_ascii=False))
 # -
 
 # ## Load configuration into EDB
 #
-# Load the configuration from the JSON file.
+# Load the configuration from the JSON file and apply it to the layout in a single call.
 
 edbapp = Edb(aedb, version=AEDT_VERSION)
-edbapp.configuration.load(config_file=pi_json)
-edbapp.configuration.run()
+edbapp.configuration.load(config_file=pi_json, apply_file=True)
 edbapp.save()
 edbapp.close()
 time.sleep(3)
@@ -15,8 +15,9 @@
 # +
 import os
 import tempfile
-import time
 
+import numpy as np
+import psutil
 import pyvista as pv
 from ansys.aedt.core import Hfss
 from ansys.aedt.core.examples.downloads import download_3dcomponent
@@ -48,8 +49,10 @@ temp_folder = tempfile.TemporaryDirectory(suffix=".ansys")
 # ### Download 3D component
 # Download the 3D component that will be used to define
 # the unit cell in the antenna array.
+# The files are only read, so they are used from the PyAEDT examples folder,
+# where they are kept for later runs.
 
-path_to_3dcomp = download_3dcomponent(local_path=temp_folder.name)
+path_to_3dcomp = download_3dcomponent()
 
 # ### Launch HFSS
 #
@@ -104,6 +107,22 @@ array_definition["Circ_Patch_5GHz1"] = os.path.join(path_to_3dcomp, "Circ_Patch_
 # in the ``"cells"`` dictionary. For example,
 # ``array_definition["cells"][0][0]["name"]
 
+# ### Rotate cells
+#
+# Rotate the corner elements.
+# The rotation of all cells is described by a NumPy matrix and written into
+# ``array_definition`` before the array is created. The array is then created
+# in HFSS with the final rotations, instead of editing it once per rotated cell.
+
+# +
+shape = (array_definition["rowdimension"], array_definition["columndimension"])
+rotation = np.zeros(shape)
+rotation[[0, 0, -1, -1], [0, -1, 0, -1]] = 90
+
+for (row, column), angle in np.ndenumerate(rotation):
+    array_definition["cells"][f"({row + 1},{column + 1})"]["rotation"] = float(angle)
+# -
+
 # ### Create the 3D component array in HFSS
 #
 # The array is now generated in HFSS from the information in
@@ -116,13 +135,10 @@ array = hfss.create_3d_component_array(array_definition, name="circ_patch_array"
 
 # ### Modify cells
 #
-# Make the center element passive and rotate the corner elements.
+# Cells of an existing array can also be modified through ``array.cells``.
+# Make the center element passive.
 
 array.cells[1][1].is_active = False
-array.cells[0][0].rotation = 90
-array.cells[0][2].rotation = 90
-array.cells[2][0].rotation = 90
-array.cells[2][2].rotation = 90
 
 # ### Set up simulation and run analysis
 #
@@ -176,9 +192,10 @@ metadata_file = antenna_data.metadata_file
 working_directory = hfss.working_directory
 
 hfss.save_project()
+aedt_process = psutil.Process(hfss.desktop_class.aedt_process_id)
 hfss.release_desktop()
-# Wait 3 seconds to allow AEDT to shut down before cleaning the temporary directory.
-time.sleep(3)
+# Wait for AEDT to shut down before cleaning the temporary directory.
+psutil.wait_procs([aedt_process], timeout=30)
 # -
 
 # ### Load far field data
@@ -14,9 +14,10 @@
 # +
 import os
 import tempfile
-import time
 
+import psutil
 from ansys.aedt.core import Hfss
+from ansys.aedt.core.generic.file_utils import read_component_file
 
 # -
 
@@ -52,7 +53,9 @@ hfss = Hfss(
     project=project_name,
     new_desktop=True,
     solution_type="Modal",
+    close_on_exit=True,
 )
+hfss.autosave_disable()  # The project is saved once at the end.
 
 # ## Model Preparation
 #
@@ -91,7 +94,7 @@ freq_step = "0.5GHz"
 #     parameter ``dipole_length`` and leave other parameters unchanged.
 
 component_fn = hfss.components3d[component_name]  # Full file name.
-comp_params = hfss.get_component_variables(component_name)  # Retrieve dipole parameters.
+comp_params = read_component_file(component_fn)  # Read dipole parameters from the file found above.
 comp_params["dipole_length"] = "l_dipole"  # Update the dipole length.
 hfss.modeler.insert_3d_component(component_fn, geometry_parameters=comp_params)
 
@@ -160,9 +163,7 @@ spar_plot = hfss.create_scattering(plot="Return Loss", sweep=interp_sweep.name)
 # > **Note:** These images were created using the 25R1 release.
 
 variations = hfss.available_variations.nominal_values
-variations["Freq"] = [center_freq]
-variations["Theta"] = ["All"]
-variations["Phi"] = ["All"]
+variations.update(Freq=[center_freq], Theta=["All"], Phi=["All"])
 elevation_ffd_plot = hfss.post.create_report(
     expressions="db(GainTheta)",
     setup_sweep_name=disc_sweep.name,
@@ -250,10 +251,9 @@ _ = ff_el_data.plot(x_label="Theta", y_label="Gain", is_polar=True)
 
 # +
 hfss.save_project()
+aedt_process = psutil.Process(hfss.desktop_class.aedt_process_id)
 hfss.release_desktop()
-
-# Wait 3 seconds to allow AEDT to shut down before cleaning the temporary directory.
-time.sleep(3)
+psutil.wait_procs([aedt_process], timeout=30)  # Wait for AEDT to shut down before cleaning the temporary directory.
 # -
 
 # ## Clean up
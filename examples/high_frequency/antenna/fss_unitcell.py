@@ -11,10 +11,10 @@
 # ### Perform imports
 
 import tempfile
-import time
 from pathlib import Path
 
 import ansys.aedt.core
+import psutil
 from ansys.aedt.core.examples.downloads import download_file
 
 # ### Define constants
@@ -46,7 +46,9 @@ hfss = ansys.aedt.core.Hfss(
     design="SquarePatch",
     non_graphical=NG_MODE,
     solution_type="Modal",
+    close_on_exit=True,
 )
+hfss.autosave_disable()  # The project is saved once at the end.
 
 # ### Define a parameter
 #
@@ -133,7 +135,7 @@ comp.parameters["a"] = "patch_dim"
 # <img src="_static/deembed.svg" width="400">
 
 # +
-period_x, period_y, z_dim = hfss.modeler.get_bounding_dimension()
+period_x, period_y, _ = hfss.modeler.get_bounding_dimension()
 
 z_extent = 2 * (period_x + period_y)
 region = hfss.modeler.create_air_region(
@@ -141,7 +143,7 @@ region = hfss.modeler.create_air_region(
     is_percentage=False,
 )
 
-[x_min, y_min, z_min, x_max, y_max, z_max] = region.bounding_box
+_, _, _, x_max, y_max, z_max = region.bounding_box
 # -
 
 # ### Assign boundary conditions and sources
@@ -201,10 +203,7 @@ hfss.create_linear_count_sweep(
 )
 
 # ### Run analysis
-#
-# Save the project and run the analysis.
 
-hfss.save_project()
 hfss.analyze()
 
 # ## Postprocess
@@ -218,9 +217,8 @@ hfss.analyze()
 # linear polarization states.
 
 plot_data = hfss.get_traces_for_plot(category="im(Z")
-msg = "The imaginary wave impedance can be displayed using "
-msg += "the traces\n"
-msg += "".join(["--> " + name + "\n" for name in plot_data])
+msg = "The imaginary wave impedance can be displayed using the traces\n"
+msg += "".join(f"--> {name}\n" for name in plot_data)
 print(msg)
 
 # The Floquet port was automatically named "port_z_max".
@@ -238,11 +236,12 @@ report = hfss.post.create_report(plot_data[0:2])
 solution = report.get_solution_data()
 plt = solution.plot(solution.expressions)
 
-# ## Release AEDT
+# ## Save project and release AEDT
 
+hfss.save_project()
+aedt_process = psutil.Process(hfss.desktop_class.aedt_process_id)
 hfss.release_desktop()
-# Wait 3 seconds to allow AEDT to shut down before cleaning the temporary directory.
-time.sleep(3)
+psutil.wait_procs([aedt_process], timeout=30)  # Wait for AEDT to shut down before cleaning the temporary directory.
 
 # ## Clean up
 #
@@ -37,10 +37,12 @@ temp_folder = tempfile.TemporaryDirectory(suffix=".ansys")
 
 # ## Download 3D component
 # Download the 3D component that is needed to run the example.
+# The library and the results archive are kept in the PyAEDT examples folder,
+# so later runs reuse them instead of downloading them again.
 
-library_path = download_multiparts(local_path=temp_folder.name)
+library_path = download_multiparts()
 
-zip_file = download_file("frtm", name="doppler_sbr.results.zip", local_path=temp_folder.name)
+zip_file = download_file("frtm", name="doppler_sbr.results.zip")
 
 results = os.path.join(temp_folder.name, "doppler_sbr.results")
 
@@ -11,6 +11,7 @@
 # directory.
 
 # +
+import shutil
 import tempfile
 import time
 
@@ -35,8 +36,11 @@ NG_MODE = False  # Open AEDT UI when it is launched.
 temp_folder = tempfile.TemporaryDirectory(suffix=".ansys")
 
 # ## Download project
+#
+# The project is kept in the PyAEDT examples folder for later runs. Because the
+# example modifies and solves it, a copy is made in the temporary folder.
 
-project_full_name = download_sbr(local_path=temp_folder.name)
+project_full_name = shutil.copy2(download_sbr(), temp_folder.name)
 
 # ## Define designs
 #
@@ -91,10 +95,8 @@ target.analyze(cores=NUM_CORES)
 # Plot results in AEDT.
 
 variations = target.available_variations.nominal_variation(dependent_params=False)
-variations["Freq"] = ["10GHz"]
-variations["Theta"] = ["All"]
-variations["Phi"] = ["All"]
-target.post.create_report(
+variations.update(Freq=["10GHz"], Theta=["All"], Phi=["All"])
+report = target.post.create_report(
     "db(GainTotal)",
     target.nominal_adaptive,
     variations=variations,
@@ -103,16 +105,9 @@ target.post.create_report(
     report_category="Far Fields",
 )
 
-# Plot results using Matplotlib.
+# Plot results using Matplotlib. The data is retrieved from the report created above.
 
-solution = target.post.get_solution_data(
-    "GainTotal",
-    target.nominal_adaptive,
-    variations=variations,
-    primary_sweep_variable="Theta",
-    context="ATK_3D",
-    report_category="Far Fields",
-)
+solution = report.get_solution_data()
 _ = solution.plot()
 
 # ## Release AEDT
@@ -56,7 +56,9 @@ hfss = ansys.aedt.core.Hfss(
     non_graphical=NG_MODE,
     new_desktop=True,
     version=AEDT_VERSION,
+    close_on_exit=True,
 )
+hfss.autosave_disable()  # The project is saved once at the end.
 
 # ### Specify units
 # Length units can be applied to the modeler in HFSS. The default frequency units, however, cannot be modified through the Python interface.
@@ -110,8 +112,6 @@ setup.create_frequency_sweep(
     stop_frequency=12,
     sweep_type="Interpolating",
 )
-
-hfss.save_project()  # Save the project.
 # -
 
 # The `hfss` instance allows you to query or modify nearly all
@@ -11,9 +11,9 @@
 # +
 import os
 import tempfile
-import time
 
 import ansys.aedt.core
+import psutil
 from ansys.aedt.core.generic.constants import Axis, Plane
 
 # -
@@ -45,8 +45,11 @@ hfss = ansys.aedt.core.Hfss(
     design="A1",
     new_desktop=True,
     solution_type="Modal",
+    close_on_exit=True,
 )
-hfss.modeler.model_units = "um"
+hfss.autosave_disable()  # Avoid save delays while the spiral is drawn.
+units = "um"
+hfss.modeler.model_units = units
 
 # ## Define variables
 #
@@ -60,8 +63,8 @@ thickness = 1
 Np = 8
 Nr = 10
 gap = 3
-hfss["Tsub"] = "6" + hfss.modeler.model_units
-hfss["thickness"] = f"{thickness} {hfss.modeler.model_units}"
+hfss["Tsub"] = f"6{units}"
+hfss["thickness"] = f"{thickness}{units}"
 
 # ## Standardize polyline
 #
@@ -114,7 +117,7 @@ hfss.modeler.create_box(
 hfss.modeler.create_rectangle(
     orientation=Plane.YZ,
     origin=[abs(x1) + 5, y0 - width / 2, -gap - thickness / 2],
-    sizes=[width, "-Tsub+{}{}".format(gap, hfss.modeler.model_units)],
+    sizes=[width, f"-Tsub+{gap}{units}"],
     name="port1",
 )
 hfss.lumped_port(assignment="port1", integration_line=Axis.Z)
@@ -152,11 +155,7 @@ hfss.modeler.create_box(
 
 # +
 box = hfss.modeler.create_box(
-    [
-        x1 - 20,
-        x1 - 20,
-        "-Tsub-thickness/2 - 0.1{}".format(hfss.modeler.model_units),
-    ],
+    [x1 - 20, x1 - 20, f"-Tsub-thickness/2 - 0.1{units}"],
     [-2 * x1 + 40, -2 * x1 + 40, 100],
     name="airbox",
     material="air",
@@ -192,7 +191,6 @@ hfss.create_linear_count_sweep(
     num_of_freq_points=451,
     sweep_type="Interpolating",
 )
-hfss.save_project()
 hfss.analyze(cores=NUM_CORES)
 
 # ## Postprocess
@@ -221,9 +219,9 @@ data.export_data_to_csv(os.path.join(hfss.toolkit_directory, "output.csv"))
 # Save the project and close AEDT.
 
 hfss.save_project()
+aedt_process = psutil.Process(hfss.desktop_class.aedt_process_id)
 hfss.release_desktop()
-# Wait 3 seconds to allow AEDT to shut down before cleaning the temporary directory.
-time.sleep(3)
+psutil.wait_procs([aedt_process], timeout=30)  # Wait for AEDT to shut down before cleaning the temporary directory.
 
 # ## Clean up
 #
@@ -12,6 +12,7 @@
 # Perform required imports.
 
 # +
+import shutil
 import tempfile
 import time
 
@@ -37,14 +38,12 @@ temp_folder = tempfile.TemporaryDirectory(suffix=".ansys")
 
 # ## Download project file
 #
-# Download the files required to run this example to the temporary working folder.
+# Download the files required to run this example and copy them to the temporary working folder.
 
-aedt_file = download_file(
-    source="maxwell_ctrl_prg",
-    name="ControlProgramDemo.aedt",
-    local_path=temp_folder.name,
-)
-ctrl_prg_file = download_file(source="maxwell_ctrl_prg", name="timestep_only.py", local_path=temp_folder.name)
+aedt_file = download_file(source="maxwell_ctrl_prg", name="ControlProgramDemo.aedt")
+aedt_file = shutil.copy2(aedt_file, temp_folder.name)
+ctrl_prg_file = download_file(source="maxwell_ctrl_prg", name="timestep_only.py")
+ctrl_prg_file = shutil.copy2(ctrl_prg_file, temp_folder.name)
 
 # ## Launch Maxwell 2D
 #
@@ -71,51 +71,39 @@ m3d.analyze(cores=NUM_CORES)
 # ## Compute mass center
 #
 # Compute mass center using PyAEDT advanced fields calculator.
-
-scalar_function = ""
-mass_center = {
-    "name": "CM_X",
-    "description": "Mass center computation",
-    "design_type": ["Maxwell 3D"],
-    "fields_type": ["Fields"],
-    "primary_sweep": "distance",
-    "assignment": "",
-    "assignment_type": ["Solid"],
-    "operations": [
-        scalar_function,
-        "EnterVolume('assignment')",
-        "Operation('VolumeValue')",
-        "Operation('Mean')",
-    ],
-    "report": ["Data Table"],
-}
-scalar_function = "Scalar_Function(FuncValue='X')"
-mass_center["operations"][0] = scalar_function
-m3d.post.fields_calculator.add_expression(mass_center, conductor.name)
-mass_center["name"] = "CM_Y"
-scalar_function = "Scalar_Function(FuncValue='Y')"
-mass_center["operations"][0] = scalar_function
-m3d.post.fields_calculator.add_expression(mass_center, conductor.name)
-mass_center["name"] = "CM_Z"
-scalar_function = "Scalar_Function(FuncValue='Z')"
-mass_center["operations"][0] = scalar_function
-m3d.post.fields_calculator.add_expression(mass_center, conductor.name)
+# One expression is created for each axis.
+
+for axis in "XYZ":
+    mass_center = {
+        "name": f"CM_{axis}",
+        "description": "Mass center computation",
+        "design_type": ["Maxwell 3D"],
+        "fields_type": ["Fields"],
+        "primary_sweep": "distance",
+        "assignment": "",
+        "assignment_type": ["Solid"],
+        "operations": [
+            f"Scalar_Function(FuncValue='{axis}')",
+            "EnterVolume('assignment')",
+            "Operation('VolumeValue')",
+            "Operation('Mean')",
+        ],
+        "report": ["Data Table"],
+    }
+    m3d.post.fields_calculator.add_expression(mass_center, conductor.name)
 
 # ## Get mass center
 #
 # Get mass center using the fields calculator.
 
-xval = m3d.post.get_scalar_field_value(quantity="CM_X")
-yval = m3d.post.get_scalar_field_value(quantity="CM_Y")
-zval = m3d.post.get_scalar_field_value(quantity="CM_Z")
+center = {axis: m3d.post.get_scalar_field_value(quantity=f"CM_{axis}") for axis in "XYZ"}
 
 # ## Create variables
 #
 # Create variables with mass center values.
 
-m3d[conductor.name + "x"] = str(xval * 1e3) + "mm"
-m3d[conductor.name + "y"] = str(yval * 1e3) + "mm"
-m3d[conductor.name + "z"] = str(zval * 1e3) + "mm"
+for axis, value in center.items():
+    m3d[conductor.name + axis.lower()] = str(value * 1e3) + "mm"
 
 # ## Create coordinate system
 #
@@ -93,12 +93,14 @@ m2d.analyze(setup=m2d.setup_names[0], cores=NUM_CORES, use_auto_settings=False)
 # ## Get expressions
 #
 # Get the available report quantities given the context
-# and the quantities category ``L``.
+# and the quantities category ``L``. The available quantities are queried once
+# and reused for both the report and the solution data.
 
+reduced_matrix_context = {"Matrix1": "ReducedMatrix1"}
 expressions = m2d.post.available_report_quantities(
     report_category="EddyCurrent",
     display_type="Data Table",
-    context={"Matrix1": "ReducedMatrix1"},
+    context=reduced_matrix_context,
     quantities_category="L",
 )
 
@@ -108,17 +110,12 @@ expressions = m2d.post.available_report_quantities(
 
 report = m2d.post.create_report(
     expressions=expressions,
-    context={"Matrix1": "ReducedMatrix1"},
+    context=reduced_matrix_context,
     plot_type="Data Table",
     setup_sweep_name="Setup1 : LastAdaptive",
     plot_name="reduced_matrix",
 )
-data = m2d.post.get_solution_data(
-    expressions=expressions,
-    context={"Matrix1": "ReducedMatrix1"},
-    report_category="EddyCurrent",
-    setup_sweep_name="Setup1 : LastAdaptive",
-)
+data = report.get_solution_data()
 
 # ## Get matrix data
 #
@@ -14,9 +14,9 @@
 # +
 import os
 import tempfile
-import time
 
 import ansys.aedt.core
+import psutil
 from ansys.aedt.core.examples.downloads import download_file
 
 # -
@@ -38,9 +38,9 @@ temp_folder = tempfile.TemporaryDirectory(suffix=".ansys")
 
 # ## Download Excel file
 #
-# Set the local temporary folder to export the Excel (XLSX) file to.
+# The Excel (XLSX) file is only read, so it is used from the PyAEDT examples folder.
 
-file_name_xlsx = download_file(source="field_line_traces", name="my_copper.xlsx", local_path=temp_folder.name)
+file_name_xlsx = download_file(source="field_line_traces", name="my_copper.xlsx")
 
 # ## Initialize dictionaries
 #
@@ -80,6 +80,7 @@ m2d = ansys.aedt.core.Maxwell2d(
     new_desktop=True,
     non_graphical=NG_MODE,
 )
+m2d.autosave_disable()  # Avoid save delays while the design is built.
 
 # ## Set modeler units
 #
@@ -91,9 +92,7 @@ m2d.modeler.model_units = "mm"
 #
 # Define design variables from the created dictionaries.
 
-for k, v in geom_params_circle.items():
-    m2d[k] = v
-for k, v in geom_params_rectangle.items():
+for k, v in {**geom_params_circle, **geom_params_rectangle}.items():
     m2d[k] = v
 
 # ## Read materials from Excel file
@@ -101,6 +100,7 @@ for k, v in geom_params_rectangle.items():
 # Read materials from the Excel file into the design.
 
 mats = m2d.materials.import_materials_from_excel(file_name_xlsx)
+mat_name = mats[0].name
 
 # ## Create design geometries
 #
@@ -112,7 +112,7 @@ rect = m2d.modeler.create_rectangle(
     origin=["r_x0", "r_y0", "r_z0"],
     sizes=["r_dx", "r_dy", 0],
     name="Ground",
-    material=mats[0],
+    material=mat_name,
 )
 rect.color = (0, 0, 255)  # rgb
 rect.solve_inside = False
@@ -123,7 +123,7 @@ circle = m2d.modeler.create_circle(
     num_sides="0",
     is_covered=True,
     name="Electrode",
-    material=mats[0],
+    material=mat_name,
 )
 circle.color = (0, 0, 255)  # rgb
 circle.solve_inside = False
@@ -155,7 +155,8 @@ setup_name = "MySetupAuto"
 setup = m2d.create_setup(name=setup_name)
 setup.props["PercentError"] = 0.5
 setup.update()
-m2d.validate_simple()
+if not NG_MODE:
+    m2d.validate_simple()  # Show validation messages in the AEDT UI.
 m2d.analyze_setup(name=setup_name, use_auto_settings=False, cores=NUM_CORES)
 
 # ## Evaluate the E Field tangential component
@@ -205,9 +206,9 @@ m2d.post.export_mesh_obj(setup=m2d.nominal_adaptive)
 # ## Release AEDT
 
 m2d.save_project()
+aedt_process = psutil.Process(m2d.desktop_class.aedt_process_id)
 m2d.release_desktop()
-# Wait 3 seconds to allow AEDT to shut down before cleaning the temporary directory.
-time.sleep(3)
+psutil.wait_procs([aedt_process], timeout=30)  # Wait for AEDT to shut down before cleaning the temporary directory.
 
 # ## Clean up
 #
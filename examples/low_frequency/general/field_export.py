@@ -138,13 +138,21 @@ time_steps = data.intrinsics["Time"]
 # The average value of the J field normal is plotted on the ``Coil_A2`` surface for every time step.
 # The J field is plotted on the surface of each coil for every time-step.
 # Fields data is exported to the temporary folder as an AEDTPLT file.
+#
+# The time steps are converted in a single call, and the coil objects and the
+# plotted quantity are looked up once before the loop.
 
+# +
 unit = data.units_sweeps["Time"]
 converted = unit_converter(time_steps, "Time", unit, "ms")
+coil_a2 = m3d.modeler.objects_by_name["Coil_A2"]
+coils = [o for o in m3d.modeler.solid_objects if o.material_name == "copper"]
+j_quantity = quantity[0]
+
 for time_step in converted:
     m3d.post.create_fieldplot_surface(
-        assignment=m3d.modeler.objects_by_name["Coil_A2"],
-        quantity=quantity[0],
+        assignment=coil_a2,
+        quantity=j_quantity,
         plot_name="J_{}_ms".format(time_step),
         intrinsics={"Time": "ms"},
     )
@@ -154,7 +162,7 @@ for time_step in converted:
         file_format="aedtplt",
     )
     m3d.post.create_fieldplot_surface(
-        assignment=[o for o in m3d.modeler.solid_objects if o.material_name == "copper"],
+        assignment=coils,
         quantity="Mag_J",
         plot_name="Mag_J_Coils_{}_ms".format(time_step),
         intrinsics={"Time": "ms"},
@@ -164,7 +172,7 @@ for time_step in converted:
         output_dir=temp_folder.name,
         file_format="aedtplt",
     )
-
+# -
 
 # ## Release AEDT
 
@@ -12,9 +12,9 @@
 # +
 import os
 import tempfile
-import time
 
 import ansys.aedt.core
+import psutil
 
 # -
 
@@ -89,6 +89,7 @@ m2d = ansys.aedt.core.Maxwell2d(
     version=AEDT_VERSION,
     non_graphical=NG_MODE,
 )
+m2d.autosave_disable()  # Avoid save delays while the design is built.
 
 # ## Define variables from dictionaries
 #
@@ -109,19 +110,10 @@ for k, v in simulation_specifications.items():
 # Define materials.
 
 m2d.variable_manager.set_variable(name="Material data")
-m2d.logger.clear_messages()
-for i, key in enumerate(materials.keys()):
-    if key == "Coil_material":
-        coil_mat_index = i
-    elif key == "Core_material":
-        core_mat_index = i
-    elif key == "Magnet_material":
-        magnet_mat_index = i
-material_array = []
-for k, v in materials.items():
-    material_array.append('"' + v + '"')
-s = ", ".join(material_array)
-m2d["Materials"] = "[{}]".format(s)
+if not NG_MODE:
+    m2d.logger.clear_messages()  # Clear the AEDT UI message window.
+mat_idx = {k: f"Materials[{i}]" for i, k in enumerate(materials)}
+m2d["Materials"] = "[{}]".format(", ".join(f'"{v}"' for v in materials.values()))
 
 # ## Create geometry
 #
@@ -132,7 +124,7 @@ core_id = m2d.modeler.create_rectangle(
     origin=[0, 0, 0],
     sizes=["Core_outer_x", "Core_outer_y"],
     name="Core",
-    material="Materials[" + str(core_mat_index) + "]",
+    material=mat_idx["Core_material"],
 )
 
 hole_id = m2d.modeler.create_rectangle(
@@ -146,13 +138,13 @@ magnet_n_id = m2d.modeler.create_rectangle(
     origin=["Core_thickness", "Core_outer_y-2*Core_thickness", 0],
     sizes=["Core_outer_x-2*Core_thickness", "Magnet_thickness"],
     name="magnet_n",
-    material="Materials[" + str(magnet_mat_index) + "]",
+    material=mat_idx["Magnet_material"],
 )
 magnet_s_id = m2d.modeler.create_rectangle(
     origin=["Core_thickness", "Core_thickness", 0],
     sizes=["Core_outer_x-2*Core_thickness", "Magnet_thickness"],
     name="magnet_s",
-    material="Materials[" + str(magnet_mat_index) + "]",
+    material=mat_idx["Magnet_material"],
 )
 
 m2d.modeler.create_coordinate_system(origin=[0, 0, 0], x_pointing=[0, 1, 0], y_pointing=[1, 0, 0], name="cs_x_positive")
@@ -173,7 +165,7 @@ coil_in_id = m2d.modeler.create_rectangle(
     ],
     sizes=["Coil_width", "Coil_thickness"],
     name="coil_in",
-    material="Materials[" + str(coil_mat_index) + "]",
+    material=mat_idx["Coil_material"],
 )
 coil_out_id = m2d.modeler.create_rectangle(
     origin=[
@@ -183,7 +175,7 @@ coil_out_id = m2d.modeler.create_rectangle(
     ],
     sizes=["Coil_width", "Coil_thickness"],
     name="coil_out",
-    material="Materials[" + str(coil_mat_index) + "]",
+    material=mat_idx["Coil_material"],
 )
 
 m2d.assign_coil(
@@ -261,7 +253,7 @@ m2d.mesh.assign_length_mesh(
     name="Bands",
 )
 m2d.mesh.assign_length_mesh(
-    assignment=[coil_in_id, coil_in_id, core_id, magnet_n_id, magnet_s_id, region_id],
+    assignment=[coil_in_id, coil_out_id, core_id, magnet_n_id, magnet_s_id, region_id],
     maximum_length="Mesh_other_objects",
     maximum_elements=None,
     name="Coils_core_magnets",
@@ -280,14 +272,19 @@ m2d.eddy_effects_on(assignment=["magnet_n", "magnet_s"])
 m2d.set_core_losses(assignment="Core")
 
 # ## Create simulation setup
-
-setup = m2d.create_setup(name="Setup1")
-setup.props["StopTime"] = "Stop_time"
-setup.props["TimeStep"] = "Time_step"
-setup.props["SaveFieldsType"] = "Every N Steps"
-setup.props["N Steps"] = "Save_fields_interval"
-setup.props["Steps From"] = "0ms"
-setup.props["Steps To"] = "Stop_time"
+#
+# The setup properties are passed to ``create_setup()`` so that the setup is
+# created with all of them at once.
+
+setup_props = {
+    "StopTime": "Stop_time",
+    "TimeStep": "Time_step",
+    "SaveFieldsType": "Every N Steps",
+    "N Steps": "Save_fields_interval",
+    "Steps From": "0ms",
+    "Steps To": "Stop_time",
+}
+setup = m2d.create_setup(name="Setup1", **setup_props)
 
 # ## Create report
 #
@@ -307,9 +304,9 @@ setup.analyze(cores=NUM_CORES, use_auto_settings=False)
 # ## Release AEDT
 
 m2d.save_project()
+aedt_process = psutil.Process(m2d.desktop_class.aedt_process_id)
 m2d.release_desktop()
-# Wait 3 seconds to allow AEDT to shut down before cleaning the temporary directory.
-time.sleep(3)
+psutil.wait_procs([aedt_process], timeout=30)  # Wait for AEDT to shut down before cleaning the temporary directory.
 
 # ## Clean up
 #
@@ -18,10 +18,11 @@
 # Perform required imports.
 
 # +
+import shutil
 import tempfile
-import time
 
 import ansys.aedt.core
+import psutil
 from ansys.aedt.core.examples.downloads import download_file
 
 # -
@@ -43,13 +44,10 @@ temp_folder = tempfile.TemporaryDirectory(suffix=".ansys")
 
 # ## Import project
 #
-# Download the files required to run this example to the temporary working folder.
+# Download the project and copy it to the temporary working folder, where it is solved.
 
-project_path = download_file(
-    source="maxwell_magnetic_force",
-    name="Maxwell_Magnetic_Force.aedt",
-    local_path=temp_folder.name,
-)
+project_path = download_file(source="maxwell_magnetic_force", name="Maxwell_Magnetic_Force.aedt")
+project_path = shutil.copy2(project_path, temp_folder.name)
 
 # ## Initialize and launch Maxwell 2D
 #
@@ -79,8 +77,8 @@ polys.extend(poly.duplicate_along_line(vector=[-0.5, 0, 0], clones=10))
 # ## Compute magnetomotive force along each line
 #
 # Create and add a new formula to add in the PyAEDT advanced fields calculator.
-# Create the fields report object and get field data.
-# Create a data table report for the H field along each line and export it to a .csv file.
+# Create a single data table report with the H field along every line, so that all
+# lines are evaluated and exported together.
 
 my_expression = {
     "name": None,
@@ -103,12 +101,13 @@ my_expression = {
 
 quantities = []
 for p in polys:
-    quantity = "H_field_{}".format(p)
+    quantity = f"H_field_{p}"
     quantities.append(quantity)
     my_expression["name"] = quantity
     my_expression["assignment"] = quantity
     m2d.post.fields_calculator.add_expression(my_expression, p)
-    report = m2d.post.create_report(expressions=quantity, report_category="Fields", plot_type="Data Table", plot_name=quantity)
+
+report = m2d.post.create_report(expressions=quantities, report_category="Fields", plot_type="Data Table", plot_name="H_field_polylines")
 
 # # Second option
 
@@ -177,22 +176,19 @@ m2d.post.export_report_to_csv(
     plot_name=quantity_sweep,
 )
 
-# Export results in a .csv file for each polyline (first option).
+# Export results in a .csv file for all polylines (first option).
 
-[
-    m2d.post.export_report_to_csv(
-        project_dir=temp_folder.name,
-        plot_name=q,
-    )
-    for q in quantities
-]
+m2d.post.export_report_to_csv(
+    project_dir=temp_folder.name,
+    plot_name=report.plot_name,
+)
 
 # ## Release AEDT
 
 m2d.save_project()
+aedt_process = psutil.Process(m2d.desktop_class.aedt_process_id)
 m2d.release_desktop()
-# Wait 3 seconds to allow AEDT to shut down before cleaning the temporary directory.
-time.sleep(3)
+psutil.wait_procs([aedt_process], timeout=30)  # Wait for AEDT to shut down before cleaning the temporary directory.
 
 # ## Clean up
 #
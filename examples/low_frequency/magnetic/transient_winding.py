@@ -26,12 +26,12 @@
 import base64
 import os
 import tempfile
-import time
 
 from IPython.display import HTML, display
 from IPython.utils import io as ipio
 
 import ansys.aedt.core
+import psutil
 
 # -
 
@@ -82,18 +82,23 @@ m2d.assign_winding(assignment=[rect1.name, rect2.name], current="1*sin(2*pi*50*T
 m2d.assign_balloon(assignment=region.edges)
 
 # ## Create transient setup
-
-setup = m2d.create_setup()
-setup.props["StopTime"] = "0.02s"
-setup.props["TimeStep"] = "0.0002s"
-setup.props["SaveFieldsType"] = "Every N Steps"
-setup.props["N Steps"] = "1"
-setup.props["Steps From"] = "0s"
-setup.props["Steps To"] = "0.002s"
+#
+# The setup properties are passed to ``create_setup()`` so that the setup is
+# created with all of them at once.
+
+setup_props = {
+    "StopTime": "0.02s",
+    "TimeStep": "0.0002s",
+    "SaveFieldsType": "Every N Steps",
+    "N Steps": "1",
+    "Steps From": "0s",
+    "Steps To": "0.002s",
+}
+setup = m2d.create_setup(**setup_props)
 
 # ## Create rectangular plot
 
-m2d.post.create_report(
+report = m2d.post.create_report(
     expressions="InputCurrent(PHA)",
     domain="Sweep",
     primary_sweep_variable="Time",
@@ -144,17 +149,17 @@ display(HTML(f'<img src="data:image/gif;base64,{gif_b64}" width="600"/>'))
 
 # ## Generate plot outside of AEDT
 #
-# Generate the same plot outside AEDT.
+# Generate the same plot outside AEDT from the data of the report created earlier.
 
-solutions = m2d.post.get_solution_data(expressions="InputCurrent(PHA)", primary_sweep_variable="Time", domain="Sweep")
+solutions = report.get_solution_data()
 _ = solutions.plot()
 
 # ## Release AEDT
 
 m2d.save_project()
+aedt_process = psutil.Process(m2d.desktop_class.aedt_process_id)
 m2d.release_desktop()
-# Wait 3 seconds to allow AEDT to shut down before cleaning the temporary directory.
-time.sleep(3)
+psutil.wait_procs([aedt_process], timeout=30)  # Wait for AEDT to shut down before cleaning the temporary directory.
 
 # ## Clean up
 #
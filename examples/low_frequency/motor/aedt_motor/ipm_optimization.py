@@ -303,50 +303,36 @@ report_core_loss_constant_mat = m2d.post.create_report(
 )
 # -
 
-# Report the torque and loss for all variations.
+# Report the torque and loss for all variations. The nominal sweep name and the
+# variations are shared by the three queries.
 
 # +
+nominal_sweep = m2d.nominal_sweep
+all_variations = {"bridge": "All", "din": "All", "Ipeak": "All", "phase_advance": "All", "mat_index": "All"}
+
 torque_data = m2d.post.get_solution_data(
     expressions=["Moving1.Torque"],
-    setup_sweep_name=m2d.nominal_sweep,
+    setup_sweep_name=nominal_sweep,
     domain="Sweep",
-    variations={
-        "bridge": "All",
-        "din": "All",
-        "Ipeak": "All",
-        "phase_advance": "All",
-        "mat_index": "All",
-    },
+    variations=all_variations,
     primary_sweep_variable="Time",
     report_category="Standard",
 )
 
 solid_loss_data = m2d.post.get_solution_data(
     expressions=["SolidLoss"],
-    setup_sweep_name=m2d.nominal_sweep,
+    setup_sweep_name=nominal_sweep,
     domain="Sweep",
-    variations={
-        "bridge": "All",
-        "din": "All",
-        "Ipeak": "All",
-        "phase_advance": "All",
-        "mat_index": "All",
-    },
+    variations=all_variations,
     primary_sweep_variable="Time",
     report_category="Standard",
 )
 
 core_loss_data = m2d.post.get_solution_data(
     expressions=["CoreLoss"],
-    setup_sweep_name=m2d.nominal_sweep,
+    setup_sweep_name=nominal_sweep,
     domain="Sweep",
-    variations={
-        "bridge": "All",
-        "din": "All",
-        "Ipeak": "All",
-        "phase_advance": "All",
-        "mat_index": "All",
-    },
+    variations=all_variations,
     primary_sweep_variable="Time",
     report_category="Standard",
 )
@@ -10,10 +10,11 @@
 # Perform required imports.
 
 # +
+import shutil
 import tempfile
-import time
 
 import ansys.aedt.core
+import psutil
 from ansys.aedt.core.examples.downloads import download_file
 
 # -
@@ -34,13 +35,10 @@ temp_folder = tempfile.TemporaryDirectory(suffix=".ansys")
 
 # ## Download AEDT file example
 #
-# Set the local temporary folder to export the AEDT file to.
+# Download the project and copy it to the local temporary folder.
 
-aedt_file = download_file(
-    source="object_segmentation",
-    name="Motor3D_obj_segments.aedt",
-    local_path=temp_folder.name,
-)
+aedt_file = download_file(source="object_segmentation", name="Motor3D_obj_segments.aedt")
+aedt_file = shutil.copy2(aedt_file, temp_folder.name)
 
 # ## Launch Maxwell 3D
 #
@@ -74,11 +72,12 @@ sheets_1 = m3d.modeler.objects_segmentation(
 # ## Segment second magnet by specifying number of segments
 #
 # Select the second magnet to segment by specifying the number of segments.
-# The following code gives the ID of the magnet as an input.
+# The following code gives the ID of the magnet as an input. The magnet is
+# retrieved from the modeler by name, which avoids scanning the whole object list.
 
 segments_number = 2
 object_name = "PM_I1_1"
-magnet_id = [obj.id for obj in m3d.modeler.object_list if obj.name == object_name][0]
+magnet_id = m3d.modeler[object_name].id
 sheets_2 = m3d.modeler.objects_segmentation(magnet_id, segments=segments_number, apply_mesh_sheets=True)
 
 # ## Segment third magnet by specifying segmentation thickness
@@ -89,7 +88,7 @@ sheets_2 = m3d.modeler.objects_segmentation(magnet_id, segments=segments_number,
 
 segmentation_thickness = 1
 object_name = "PM_O1"
-magnet = [obj for obj in m3d.modeler.object_list if obj.name == object_name][0]
+magnet = m3d.modeler[object_name]
 sheets_3 = m3d.modeler.objects_segmentation(magnet, segmentation_thickness=segmentation_thickness, apply_mesh_sheets=True)
 
 # ## Segment fourth magnet by specifying number of segments
@@ -104,9 +103,9 @@ sheets_4 = m3d.modeler.objects_segmentation(object_name, segments=segments_numbe
 # ## Release AEDT
 
 m3d.save_project()
+aedt_process = psutil.Process(m3d.desktop_class.aedt_process_id)
 m3d.release_desktop()
-# Wait 3 seconds to allow AEDT to shut down before cleaning the temporary directory.
-time.sleep(3)
+psutil.wait_procs([aedt_process], timeout=30)  # Wait for AEDT to shut down before cleaning the temporary directory.
 
 # ## Clean up
 #
@@ -803,8 +803,9 @@ for k, v in output_vars.items():
 # report by specifying only its expressions and plot name. This avoids repeating the
 # same arguments for every ``create_report`` call.
 
+nominal_sweep = m2d.nominal_sweep
 report_kwargs = dict(
-    setup_sweep_name=m2d.nominal_sweep,
+    setup_sweep_name=nominal_sweep,
     domain="Sweep",
     primary_sweep_variable="Time",
     plot_type="Rectangular Plot",
@@ -863,7 +864,7 @@ m2d.post.plot_field_from_fieldplot(plot1.name, show=False)
 
 solutions = m2d.post.get_solution_data(
     expressions="Moving1.Torque",
-    setup_sweep_name=m2d.nominal_sweep,
+    setup_sweep_name=nominal_sweep,
     primary_sweep_variable="Time",
     domain="Sweep",
 )
@@ -10,13 +10,14 @@
 # Perform required imports.
 
 # +
+import shutil
 import tempfile
 import time
 
+import numpy as np
 from ansys.aedt.core import Maxwell3d
 from ansys.aedt.core.examples import downloads
 from ansys.aedt.core.generic.constants import unit_converter
-from ansys.aedt.core.generic.file_utils import read_csv_pandas
 
 # -
 
@@ -36,33 +37,30 @@ temp_folder = tempfile.TemporaryDirectory(suffix=".ansys")
 
 # ## Download AEDT file example
 #
-# Download the files required to run this example to the temporary working folder.
+# Download the files required to run this example. The project is copied to the
+# temporary working folder because AEDT writes its results next to it.
 
-# +
 aedt_file = downloads.download_file(
     source="core_loss_transformer",
     name="Ex2-PlanarTransformer_2023R2.aedtz",
-    local_path=temp_folder.name,
 )
-freq_curve_csv_25kHz = downloads.download_file(source="core_loss_transformer", name="mf3_25kHz.csv", local_path=temp_folder.name)
-freq_curve_csv_100kHz = downloads.download_file(source="core_loss_transformer", name="mf3_100kHz.csv", local_path=temp_folder.name)
-freq_curve_csv_200kHz = downloads.download_file(source="core_loss_transformer", name="mf3_200kHz.csv", local_path=temp_folder.name)
-freq_curve_csv_400kHz = downloads.download_file(source="core_loss_transformer", name="mf3_400kHz.csv", local_path=temp_folder.name)
-freq_curve_csv_700kHz = downloads.download_file(source="core_loss_transformer", name="mf3_700kHz.csv", local_path=temp_folder.name)
-freq_curve_csv_1MHz = downloads.download_file(source="core_loss_transformer", name="mf3_1MHz.csv", local_path=temp_folder.name)
-
-data = read_csv_pandas(input_file=freq_curve_csv_25kHz)
-curves_csv_25kHz = list(zip(data[data.columns[0]], data[data.columns[1]]))
-data = read_csv_pandas(input_file=freq_curve_csv_100kHz)
-curves_csv_100kHz = list(zip(data[data.columns[0]], data[data.columns[1]]))
-data = read_csv_pandas(input_file=freq_curve_csv_200kHz)
-curves_csv_200kHz = list(zip(data[data.columns[0]], data[data.columns[1]]))
-data = read_csv_pandas(input_file=freq_curve_csv_400kHz)
-curves_csv_400kHz = list(zip(data[data.columns[0]], data[data.columns[1]]))
-data = read_csv_pandas(input_file=freq_curve_csv_700kHz)
-curves_csv_700kHz = list(zip(data[data.columns[0]], data[data.columns[1]]))
-data = read_csv_pandas(input_file=freq_curve_csv_1MHz)
-curves_csv_1MHz = list(zip(data[data.columns[0]], data[data.columns[1]]))
+aedt_file = shutil.copy2(aedt_file, temp_folder.name)
+
+# Download the power-volume curves. Each entry maps a frequency in kHz to the
+# CSV file holding its curve, which is read as a list of ``[x, y]`` pairs.
+
+# +
+curve_files = {
+    25: "mf3_25kHz.csv",
+    100: "mf3_100kHz.csv",
+    200: "mf3_200kHz.csv",
+    400: "mf3_400kHz.csv",
+    700: "mf3_700kHz.csv",
+}
+curves = {}
+for freq_khz, name in curve_files.items():
+    csv_file = downloads.download_file(source="core_loss_transformer", name=name)
+    curves[freq_khz] = np.loadtxt(csv_file, delimiter=",", skiprows=1, usecols=(0, 1)).tolist()
 # -
 
 # ## Launch AEDT and Maxwell 3D
@@ -85,18 +83,7 @@ m3d = Maxwell3d(
 # and finally set the Power-Ferrite core loss model.
 
 mat = m3d.materials.add_material("newmat")
-freq_25kHz = unit_converter(values=25, unit_system="Freq", input_units="kHz", output_units="Hz")
-freq_100kHz = unit_converter(values=100, unit_system="Freq", input_units="kHz", output_units="Hz")
-freq_200kHz = unit_converter(values=200, unit_system="Freq", input_units="kHz", output_units="Hz")
-freq_400kHz = unit_converter(values=400, unit_system="Freq", input_units="kHz", output_units="Hz")
-freq_700kHz = unit_converter(values=700, unit_system="Freq", input_units="kHz", output_units="Hz")
-pv = {
-    freq_25kHz: curves_csv_25kHz,
-    freq_100kHz: curves_csv_100kHz,
-    freq_200kHz: curves_csv_200kHz,
-    freq_400kHz: curves_csv_400kHz,
-    freq_700kHz: curves_csv_700kHz,
-}
+pv = {unit_converter(freq_khz, "Freq", "kHz", "Hz"): points for freq_khz, points in curves.items()}
 m3d.materials[mat.name].set_coreloss_at_frequency(
     points_at_frequency=pv,
     coefficient_setup="kw_per_cubic_meter",